@@ -1,7 +1,46 @@
 import json
-from decimal import Decimal
+import os
+import pickle
+from collections import OrderedDict
 from threading import Lock
-from typing import Optional, List, Sequence
+from typing import Optional, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _convert_scalar(a1: float, b1: float, c1: float, d1: float,
+                    a2: float, b2: float, c2: float, d2: float, value: float) -> float:
+    """
+    Convert a value from the unit with factors a1..d1 to the unit with
+    factors a2..d2 through the common base unit, as one flat expression.
+    Compiled with numba when it is installed; plain Python otherwise.
+    :param value: value to convert
+    :return: converted value
+    """
+    base = (a1 * value + b1) / (c1 * value + d1)
+    return (b2 - d2 * base) / (c2 * base - a2)
+
+
+try:
+    from numba import njit
+    _convert_scalar = njit(cache=True)(_convert_scalar)
+except ImportError:
+    pass
+
+# Parsed content of UNITS_FILE, shared by all UnitManager instances in the
+# process so only the first instantiation pays for reading and parsing it.
+_PARSED_JSON = None
+
+# Parsed content of UNIT_ALIASES_FILE, cached the same way.
+_ALIASES_CACHE = None
 
 
 class Unit:
@@ -14,114 +53,45 @@ class Unit:
     y is the value in this unit
     a, b, c, and d are the conversion factors
     """
-    name_: str
-    symbol_: str
-    a_: Decimal
-    b_: Decimal
-    c_: Decimal
-    d_: Decimal
-    display_symbol_: str
-
-    def __init__(self, name: str, symbol: str, a: Decimal, b: Decimal, c: Decimal, d: Decimal, display_symbol: str):
-        self.name_ = name
-        self.symbol_ = symbol
-        self.a_ = a
-        self.b_ = b
-        self.c_ = c
-        self.d_ = d
-        self.display_symbol_ = display_symbol
-
-    @property
-    def name(self) -> str:
-        """
-        Get the name of the unit
-        :return: name of the unit
-        """
-        return self.name_
-
-    @property
-    def symbol(self) -> str:
-        """
-        Get the symbol of the unit
-        :return: symbol of the unit
-        """
-        return self.symbol_
-
-    @property
-    def get_a(self) -> Decimal:
-        """
-        Get the conversion factor a
-        :return: conversion factor a
-        """
-        return self.a_
-
-    @property
-    def get_b(self) -> Decimal:
-        """
-        Get the conversion factor b
-        :return: conversion factor b
-        """
-        return self.b_
-
-    @property
-    def get_c(self) -> Decimal:
-        """
-        Get the conversion factor c
-        :return: conversion factor c
-        """
-        return self.c_
-
-    @property
-    def get_d(self) -> Decimal:
-        """
-        Get the conversion factor d
-        :return: conversion factor d
-        """
-        return self.d_
-
-    @property
-    def display_symbol(self) -> str:
-        """
-        Get the display symbol of the unit
-        :return: display symbol of the unit
-        """
-        return self.display_symbol_
-
-    def to_base(self, value: Decimal) -> Decimal:
+    __slots__ = ('name', 'symbol', 'a', 'b', 'c', 'd', 'display_symbol', '_repr_cache')
+
+    def __init__(self, name: str, symbol: str, a: float, b: float, c: float, d: float, display_symbol: str):
+        self.name = name
+        self.symbol = symbol
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.display_symbol = display_symbol
+        self._repr_cache = None
+
+    def to_base(self, value: float) -> float:
         """
         Convert the value to the base unit
         :param value: value to convert
         :return: converted value
         """
-        return ((self.a_ * value) + self.b_) / ((self.c_ * value) + self.d_)
+        return ((self.a * value) + self.b) / ((self.c * value) + self.d)
 
-    def from_base(self, value: Decimal) -> Decimal:
+    def from_base(self, value: float) -> float:
         """
         Convert the value from the base unit
         :param value: value to convert
         :return: converted value
         """
-        return (self.b_ - (self.d_ * value)) / ((self.c_ * value) - self.a_)
+        return (self.b - (self.d * value)) / ((self.c * value) - self.a)
 
     def __str__(self):
-        return f'{self.name_} [{self.symbol_}] a={self.a_}, b={self.b_}, c={self.c_}, d={self.d_}'
+        return self.__repr__()
 
     def __repr__(self):
-        return f'{self.name_} [{self.symbol_}] a={self.a_}, b={self.b_}, c={self.c_}, d={self.d_}'
-
-    def __eq__(self, other):
-        return (self.name_ == other.name_ and self.symbol_ == other.symbol_ and self.a_ == other.a_ and
-                self.b_ == other.b_ and self.c_ == other.c_ and self.d_ == other.d_)
-
-    def __hash__(self):
-        return int(
-                1 * self.name_.__hash__() +
-                3 * self.symbol_.__hash__() +
-                7 * float(self.a_).__hash__() +
-                11 * float(self.b_).__hash__() +
-                13 * float(self.c_).__hash__() +
-                17 * float(self.d_.__hash__())
-        )
+        # Units are immutable after loading, so the formatted string is
+        # built once and reused.
+        result = self._repr_cache
+        if result is None:
+            result = f'{self.name} [{self.symbol}] a={self.a}, b={self.b}, c={self.c}, d={self.d}'
+            self._repr_cache = result
+        return result
 
 
 class Quantity:
@@ -129,28 +99,12 @@ class Quantity:
     This class is used to represent a quantity of measurement. It contains the name of the quantity and the units that
     are associated with the quantity.
     """
-    name_: str
-    units_: list[Unit]
+    __slots__ = ('name', 'units', '_unit_set')
 
     def __init__(self, name: str, units: list = None):
-        self.name_ = name
-        self.units_ = units or []
-
-    @property
-    def name(self) -> str:
-        """
-        Get the name of the quantity
-        :return: name of the quantity
-        """
-        return self.name_
-
-    @property
-    def units(self) -> list:
-        """
-        Get the units associated with the quantity
-        :return: units associated with the quantity
-        """
-        return self.units_
+        self.name = name
+        self.units = units or []
+        self._unit_set = set(self.units)
 
     def add_unit(self, unit: Unit, is_base_unit: bool = False):
         """
@@ -159,9 +113,10 @@ class Quantity:
         :param is_base_unit: whether the unit is the base unit of the quantity
         """
         if is_base_unit:
-            self.units_.insert(0, unit)
+            self.units.insert(0, unit)
         else:
-            self.units_.append(unit)
+            self.units.append(unit)
+        self._unit_set.add(unit)
 
     @property
     def base_unit(self) -> Unit:
@@ -169,12 +124,12 @@ class Quantity:
         Get the base unit of the quantity
         :return: base unit of the quantity
         """
-        return self.units_[0]
+        return self.units[0]
 
     def __str__(self):
         def get_unit_str():
-            return '\n'.join([f"{unit.name} ({unit.display_symbol})" for unit in self.units_])
-        return f'Quantity Name: {self.name_} \nUnits: \n{get_unit_str()}'
+            return '\n'.join([f"{unit.name} ({unit.display_symbol})" for unit in self.units])
+        return f'Quantity Name: {self.name} \nUnits: \n{get_unit_str()}'
 
 
 class UnitManager:
@@ -185,14 +140,26 @@ class UnitManager:
     It is a singleton class, so it can be accessed using the get_instance() method.
     """
     UNITS_FILE = "poum/uom.json"
+    UNITS_PICKLE_FILE = "poum/uom.pkl"
     UNIT_ALIASES_FILE = "poum/unit_aliases.txt"
+    PAIR_CACHE_SIZE = 1024
 
     _instance = None
     _lock = Lock()
 
     def __init__(self):
         self.unit_aliases_ = {}
-        self.quantities_ = set()
+        self.quantities_ = {}
+        self._units_by_symbol = {}
+        self._units_by_symbol_lower = {}
+        self._quantities_by_unit_id = {}
+        self._quantities_by_unit_cache = {}
+        # Single fused lookup table: exact symbols, lowercased symbols and
+        # alias keys all point directly at their Unit instance. _alias_keys
+        # records which entries are owned by an alias registration.
+        self._resolve = {}
+        self._alias_keys = set()
+        self._pair_cache = OrderedDict()
         self._load_from_json()
         self._load_unit_aliases()
 
@@ -202,9 +169,10 @@ class UnitManager:
         Get the singleton instance of the UnitManager class
         :return: instance of the UnitManager class
         """
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = cls()
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     def add_unit_alias(self, unit_symbol_alias: str, unit_symbol: str):
@@ -213,28 +181,28 @@ class UnitManager:
         if unit_symbol is None:
             raise ValueError("unitSymbol cannot be null")
         self.unit_aliases_[unit_symbol_alias.lower()] = unit_symbol
+        self._index_alias(unit_symbol_alias.lower(), unit_symbol)
+        self._pair_cache.clear()
 
     def get_quantities(self):
-        return self.quantities_
+        return list(self.quantities_.values())
 
     def add_quantity(self, quantity: Quantity):
         if quantity is None:
             raise ValueError("quantity cannot be null")
         if self.find_quantity(quantity.name) is not None:
             raise ValueError(f"Quantity is already present: {quantity.name}")
-        self.quantities_.add(quantity)
+        self._index_quantity(quantity)
+        self._pair_cache.clear()
 
     def find_quantity(self, quantity_name: str) -> Quantity | None:
         if quantity_name is None:
             raise ValueError("quantityName cannot be null")
-        for quantity in self.quantities_:
-            if quantity.name == quantity_name:
-                return quantity
-        return None
+        return self.quantities_.get(quantity_name)
 
     def get_units(self):
         units = {}
-        for quantity in self.quantities_:
+        for quantity in self.quantities_.values():
             for unit in quantity.units:
                 units[unit.name] = unit
         return list(units.values())
@@ -243,30 +211,25 @@ class UnitManager:
         if unit_symbol is None or unit_symbol.strip() == "":
             unit_symbol = "unitless"
 
-        lower_case_symbol = unit_symbol.lower().strip()
-
-        actual_unit_symbol = self.unit_aliases_.get(lower_case_symbol)
-        if actual_unit_symbol is not None:
-            unit_symbol = actual_unit_symbol
-
-        for quantity in self.quantities_:
-            for unit in quantity.units:
-                if unit.symbol == unit_symbol:
-                    return unit
-
-        for quantity in self.quantities_:
-            for unit in quantity.units:
-                if unit.symbol.lower() == lower_case_symbol:
-                    return unit
-
-        return None
+        unit = self._resolve.get(unit_symbol)
+        if unit is None:
+            lower_case_symbol = unit_symbol.lower().strip()
+            unit = self._resolve.get(lower_case_symbol)
+            if unit is None:
+                # An alias registered before its target unit existed is not
+                # linked in _resolve yet; retry it now that the unit may be.
+                actual_unit_symbol = self.unit_aliases_.get(lower_case_symbol)
+                if actual_unit_symbol is not None:
+                    self._index_alias(lower_case_symbol, actual_unit_symbol)
+                    unit = self._resolve.get(lower_case_symbol)
+        return unit
 
     def find_convertible_units(self, unit: Unit) -> List[Unit]:
         if unit is None:
             raise ValueError("unit cannot be null")
         units = set()
-        for quantity in self.quantities_:
-            if unit in quantity.units:
+        for quantity in self.quantities_.values():
+            if unit in quantity._unit_set:
                 units.update(quantity.units)
         units.discard(unit)
         return list(units)
@@ -278,16 +241,23 @@ class UnitManager:
     def find_quantities_by_unit(self, unit: Unit) -> List[Quantity]:
         if unit is None:
             raise ValueError("unit cannot be null")
-        quantities = []
-        for quantity in self.quantities_:
-            if unit in quantity.units:
-                quantities.append(quantity)
-        euclid_unit = self.find_unit("Euc")
-        for quantity in quantities:
-            if euclid_unit in quantity.units:
-                quantities.append(self.find_quantity("dimensionless"))
-                break
-        return quantities
+        result = self._quantities_by_unit_cache.get(id(unit))
+        if result is None:
+            quantities = self._quantities_by_unit_id.get(id(unit))
+            if quantities is None:
+                # Units unknown to the catalog are not cached: nothing keeps
+                # their id() alive, and transient units would otherwise grow
+                # the cache without bound.
+                return []
+            quantities = list(quantities)
+            euclid_unit = self.find_unit("Euc")
+            for quantity in quantities:
+                if euclid_unit in quantity._unit_set:
+                    quantities.append(self.find_quantity("dimensionless"))
+                    break
+            result = tuple(quantities)
+            self._quantities_by_unit_cache[id(unit)] = result
+        return list(result)
 
     def find_quantities_by_symbol(self, unit_symbol: str) -> List[Quantity]:
         unit = self.find_unit(unit_symbol)
@@ -320,23 +290,75 @@ class UnitManager:
         unit2 = self.find_unit(unit_symbol2)
         return self.can_convert(unit1, unit2) if unit1 and unit2 else False
 
-    def convert(self, from_unit: Unit | str, to_unit: Unit | str, value: Decimal) -> Decimal:
-        if isinstance(from_unit, str):
-            from_unit = self.find_unit(from_unit)
-        if isinstance(to_unit, str):
-            to_unit = self.find_unit(to_unit)
+    def convert(self, from_unit: Unit | str, to_unit: Unit | str, value: float) -> float:
+        if isinstance(from_unit, str) and isinstance(to_unit, str):
+            from_unit, to_unit = self._resolve_pair(from_unit, to_unit)
+        else:
+            if isinstance(from_unit, str):
+                from_unit = self.find_unit(from_unit)
+            if isinstance(to_unit, str):
+                to_unit = self.find_unit(to_unit)
         if from_unit is None or to_unit is None:
             raise ValueError("fromUnit and toUnit cannot be null")
-        base_value = from_unit.to_base(value)
-        return to_unit.from_base(base_value)
+        return _convert_scalar(from_unit.a, from_unit.b, from_unit.c, from_unit.d,
+                               to_unit.a, to_unit.b, to_unit.c, to_unit.d, value)
 
-    def convert_by_symbol(self, from_unit_symbol: str, to_unit_symbol: str, value: Decimal) -> Decimal:
+    def _resolve_pair(self, from_unit_symbol: str, to_unit_symbol: str) -> tuple:
+        """
+        Resolve a (from, to) symbol pair to the corresponding units, memoized
+        in a small LRU cache so repeated conversions skip the symbol lookups.
+        :param from_unit_symbol: symbol of the unit to convert from
+        :param to_unit_symbol: symbol of the unit to convert to
+        :return: tuple of (from unit, to unit)
+        """
+        key = (from_unit_symbol, to_unit_symbol)
+        # pop + re-insert refreshes the LRU position in single atomic steps;
+        # a separate get/move_to_end pair could see the key evicted by a
+        # concurrent insert in between.
+        pair = self._pair_cache.pop(key, None)
+        if pair is not None:
+            self._pair_cache[key] = pair
+            return pair
+        pair = (self.find_unit(from_unit_symbol), self.find_unit(to_unit_symbol))
+        if pair[0] is not None and pair[1] is not None:
+            self._pair_cache[key] = pair
+            if len(self._pair_cache) > self.PAIR_CACHE_SIZE:
+                self._pair_cache.popitem(last=False)
+        return pair
+
+    def convert_by_symbol(self, from_unit_symbol: str, to_unit_symbol: str, value: float) -> float:
         if from_unit_symbol is None or to_unit_symbol is None:
             raise ValueError("fromUnitSymbol and toUnitSymbol cannot be null")
-        from_unit = self.find_unit(from_unit_symbol)
-        to_unit = self.find_unit(to_unit_symbol)
+        from_unit, to_unit = self._resolve_pair(from_unit_symbol, to_unit_symbol)
         return self.convert(from_unit, to_unit, value) if from_unit and to_unit else value
 
+    def convert_array(self, from_unit: Unit | str, to_unit: Unit | str, values):
+        """
+        Convert a sequence of values from one unit to another. The units are
+        resolved once for the whole sequence, and the conversion runs as a
+        single vectorized expression when numpy is available (accepting and
+        returning a numpy array), falling back to a plain Python loop over
+        the sequence otherwise.
+        :param from_unit: unit (or unit symbol) to convert from
+        :param to_unit: unit (or unit symbol) to convert to
+        :param values: sequence of values to convert
+        :return: converted values
+        """
+        if isinstance(from_unit, str) and isinstance(to_unit, str):
+            from_unit, to_unit = self._resolve_pair(from_unit, to_unit)
+        else:
+            if isinstance(from_unit, str):
+                from_unit = self.find_unit(from_unit)
+            if isinstance(to_unit, str):
+                to_unit = self.find_unit(to_unit)
+        if from_unit is None or to_unit is None:
+            raise ValueError("fromUnit and toUnit cannot be null")
+        if numpy is not None:
+            x = numpy.asarray(values, dtype=float)
+            base = (from_unit.a * x + from_unit.b) / (from_unit.c * x + from_unit.d)
+            return (to_unit.b - to_unit.d * base) / (to_unit.c * base - to_unit.a)
+        return [to_unit.from_base(from_unit.to_base(value)) for value in values]
+
     @staticmethod
     def get_display_symbol_by_unit(unit: Unit) -> str:
         return unit.display_symbol if unit else ""
@@ -346,62 +368,157 @@ class UnitManager:
         quantity = self.find_quantity(quantity_name)
         if quantity is None:
             quantity = Quantity(quantity_name)
-            self.quantities_.add(quantity)
+            self._index_quantity(quantity)
         return quantity
 
+    def add_unit_to_quantity(self, quantity: Quantity, unit: Unit, is_base_unit: bool = False):
+        """
+        Add a unit to a quantity and keep the manager's lookup indexes in
+        sync. Quantities known to the manager must be extended through this
+        method rather than Quantity.add_unit, which cannot update the
+        indexes.
+        :param quantity: quantity to add the unit to
+        :param unit: unit to add
+        :param is_base_unit: whether the unit is the base unit of the quantity
+        """
+        if quantity is None:
+            raise ValueError("quantity cannot be null")
+        if unit is None:
+            raise ValueError("unit cannot be null")
+        quantity.add_unit(unit, is_base_unit)
+        self._index_quantity(quantity)
+        self._pair_cache.clear()
+
+    def _index_unit(self, unit: Unit):
+        self._units_by_symbol[unit.symbol] = unit
+        self._units_by_symbol_lower.setdefault(unit.symbol.lower(), unit)
+        # Exact symbols always win over lowercased fallback entries; aliases
+        # are layered on top afterwards by _index_alias.
+        self._resolve[unit.symbol] = unit
+        self._resolve.setdefault(unit.symbol.lower(), unit)
+
+    def _index_alias(self, unit_symbol_alias: str, unit_symbol: str):
+        unit = self._units_by_symbol.get(unit_symbol)
+        if unit is None:
+            unit = self._units_by_symbol_lower.get(unit_symbol.lower().strip())
+        if unit is not None:
+            self._resolve[unit_symbol_alias] = unit
+            self._alias_keys.add(unit_symbol_alias)
+        elif unit_symbol_alias in self._alias_keys:
+            # The alias was re-registered to a target that does not resolve;
+            # unlink the stale entry and restore any symbol entry the alias
+            # had shadowed.
+            self._alias_keys.discard(unit_symbol_alias)
+            fallback = self._units_by_symbol.get(unit_symbol_alias)
+            if fallback is None:
+                fallback = self._units_by_symbol_lower.get(unit_symbol_alias)
+            if fallback is not None:
+                self._resolve[unit_symbol_alias] = fallback
+            else:
+                self._resolve.pop(unit_symbol_alias, None)
+
+    def _index_quantity(self, quantity: Quantity):
+        self.quantities_[quantity.name] = quantity
+        for unit in quantity.units:
+            if unit is None:
+                continue
+            self._index_unit(unit)
+            quantities = self._quantities_by_unit_id.setdefault(id(unit), [])
+            if quantity not in quantities:
+                quantities.append(quantity)
+        self._quantities_by_unit_cache.clear()
+
     def _load_unit_aliases(self):
+        global _ALIASES_CACHE
+        if _ALIASES_CACHE is None:
+            try:
+                with open(self.UNIT_ALIASES_FILE, 'r') as stream:
+                    content = stream.read()
+            except IOError:
+                return
+            aliases = {}
+            for line in content.splitlines():
+                if line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split('=', 1)
+                aliases[key.strip()] = value.strip()
+            _ALIASES_CACHE = aliases
+        self.unit_aliases_.update(_ALIASES_CACHE)
+        for alias, symbol in _ALIASES_CACHE.items():
+            self._index_alias(alias, symbol)
+
+    def _load_from_pickle(self) -> bool:
+        """
+        Restore the built catalog from the pickle written by a previous run.
+        :return: True when the catalog was restored, False when the pickle is
+                 missing, stale or unreadable
+        """
         try:
-            with open(self.UNIT_ALIASES_FILE, 'r') as stream:
-                for line in stream.readlines():
-                    if line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.strip().split('=')
-                    self.unit_aliases_[key.strip()] = value.strip()
-        except IOError:
-            pass
-
-    @staticmethod
-    def _find_unit_by_name(units: Sequence[Unit], name: str) -> Optional[Unit]:
+            if os.path.getmtime(self.UNITS_PICKLE_FILE) < os.path.getmtime(self.UNITS_FILE):
+                return False
+            with open(self.UNITS_PICKLE_FILE, 'rb') as stream:
+                units, quantities = pickle.load(stream)
+        except Exception:
+            return False
         for unit in units:
-            if unit.name == name:
-                return unit
-        return None
+            self._index_unit(unit)
+        for quantity in quantities.values():
+            self._index_quantity(quantity)
+        return True
+
+    def _save_pickle(self, units: List[Unit]):
+        try:
+            with open(self.UNITS_PICKLE_FILE, 'wb') as stream:
+                pickle.dump((units, self.quantities_), stream, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
 
     def _load_from_json(self):
-        units = []
+        global _PARSED_JSON
+        if self._load_from_pickle():
+            return
         try:
-            with open(self.UNITS_FILE, 'r') as stream:
-                energistics_standard = json.load(stream)
-
-                unit_objects = energistics_standard.get("units", [])
-                for unit_object in unit_objects:
-                    name = unit_object["name"]
-                    symbol = unit_object["symbol"]
-                    a = unit_object["a"]
-                    b = unit_object["b"]
-                    c = unit_object["c"]
-                    d = unit_object["d"]
-                    display_symbol = unit_object.get("display_symbol", symbol)
-                    unit = Unit(name, symbol, a, b, c, d, display_symbol)
-                    units.append(unit)
-
-                quantity_objects = energistics_standard.get("quantities", [])
-                for quantity_object in quantity_objects:
-                    name = quantity_object["name"]
-                    description = quantity_object.get("description", None)
-                    quantity = Quantity(name, description)
-                    self.quantities_.add(quantity)
-                    member_units = quantity_object.get("units", [])
-                    for unit_name in member_units:
-                        unit = self._find_unit_by_name(units, unit_name)
-                        quantity.add_unit(unit, False)
+            if _PARSED_JSON is None:
+                with open(self.UNITS_FILE, 'rb') as stream:
+                    content = stream.read()
+                _PARSED_JSON = orjson.loads(content) if orjson is not None else json.loads(content)
+            energistics_standard = _PARSED_JSON
+
+            # One traversal of the catalog builds the Unit objects, the
+            # Quantity objects and all lookup indexes together.
+            units_by_name = {}
+            unit_objects = energistics_standard.get("units", [])
+            for unit_object in unit_objects:
+                name = unit_object["name"]
+                symbol = unit_object["symbol"]
+                a = float(unit_object["a"])
+                b = float(unit_object["b"])
+                c = float(unit_object["c"])
+                d = float(unit_object["d"])
+                display_symbol = unit_object.get("display_symbol", symbol)
+                unit = Unit(name, symbol, a, b, c, d, display_symbol)
+                units_by_name[name] = unit
+                self._index_unit(unit)
+
+            quantity_objects = energistics_standard.get("quantities", [])
+            for quantity_object in quantity_objects:
+                name = quantity_object["name"]
+                description = quantity_object.get("description", None)
+                quantity = Quantity(name, description)
+                member_units = quantity_object.get("units", [])
+                for unit_name in member_units:
+                    unit = units_by_name.get(unit_name)
+                    quantity.add_unit(unit, False)
+                self._index_quantity(quantity)
+
+            self._save_pickle(list(units_by_name.values()))
 
         except Exception as e:
             print(e)
 
     def __str__(self):
         s = [f"Quantities....: {len(self.quantities_)}\n"]
-        n_units = sum(len(quantity.units) for quantity in self.quantities_)
+        n_units = sum(len(quantity.units) for quantity in self.quantities_.values())
         s.append(f"Units.........: {n_units}\n")
         s.append(f"Unit aliases..: {len(self.unit_aliases_)}")
         return ''.join(s)
@@ -1,4 +1,4 @@
-from poum import UnitManager
+from poum import Quantity, Unit, UnitManager
 
 
 def test_find_quantity():
@@ -16,6 +16,12 @@ def test_find_unit():
     assert unit.symbol == "ohm.m"
 
 
+def test_find_unit_unknown_symbol():
+    unit_manager = UnitManager.get_instance()
+    assert unit_manager.find_unit("no-such-unit") is None
+    assert unit_manager.find_unit("no-such-unit") is None
+
+
 def test_find_quantities_by_unit():
     unit_manager = UnitManager.get_instance()
     unit = unit_manager.find_unit("ohm.m")
@@ -38,6 +44,13 @@ def test_convert():
     assert kilometers_per_our == 88.51392
 
 
+def test_convert_array():
+    unit_manager = UnitManager.get_instance()
+    miles_per_hour = [55.0, 110.0]
+    kilometers_per_hour = unit_manager.convert_array("mi/h", "km/h", miles_per_hour)
+    assert list(kilometers_per_hour) == [unit_manager.convert("mi/h", "km/h", v) for v in miles_per_hour]
+
+
 def test_find_convertible_units():
     unit_manager = UnitManager.get_instance()
     unit = unit_manager.find_unit("mi/h")
@@ -65,3 +78,43 @@ def test_can_convert():
     assert not unit_manager.can_convert(unit1, unit3)
 
 
+def test_add_quantity():
+    unit_manager = UnitManager.get_instance()
+    unit = Unit("test unit", "TQx", 1.0, 0.0, 0.0, 1.0, "TQx")
+    quantity = Quantity("test quantity", [unit])
+    unit_manager.add_quantity(quantity)
+    assert unit_manager.find_quantity("test quantity") is quantity
+    assert unit_manager.find_unit("TQx") is unit
+    quantities = unit_manager.find_quantities_by_unit(unit)
+    assert quantities == [quantity]
+
+
+def test_add_unit_to_quantity():
+    unit_manager = UnitManager.get_instance()
+    quantity = unit_manager.find_or_create_quantity("another test quantity")
+    unit = Unit("another test unit", "TQy", 2.0, 0.0, 0.0, 1.0, "TQy")
+    unit_manager.add_unit_to_quantity(quantity, unit, is_base_unit=True)
+    assert quantity.base_unit is unit
+    assert unit_manager.find_unit("TQy") is unit
+    assert unit_manager.find_quantities_by_unit(unit) == [quantity]
+
+
+def test_readd_unit_alias():
+    unit_manager = UnitManager.get_instance()
+    unit_manager.add_unit_alias("edgecase", "m")
+    assert unit_manager.find_unit("edgecase").symbol == "m"
+    unit_manager.add_unit_alias("edgecase", "NOPE_XYZ")
+    assert unit_manager.find_unit("edgecase") is None
+    unit_manager.add_unit_alias("edgecase", "km")
+    assert unit_manager.find_unit("edgecase").symbol == "km"
+
+
+def test_add_unit_alias_before_unit_exists():
+    unit_manager = UnitManager.get_instance()
+    unit_manager.add_unit_alias("tee-cue-zed", "TQz")
+    assert unit_manager.find_unit("tee-cue-zed") is None
+    unit = Unit("late test unit", "TQz", 3.0, 0.0, 0.0, 1.0, "TQz")
+    unit_manager.add_quantity(Quantity("late test quantity", [unit]))
+    assert unit_manager.find_unit("tee-cue-zed") is unit
+
+